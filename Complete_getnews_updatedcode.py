@@ -17,21 +17,13 @@ from bs4 import BeautifulSoup
 import os
 
 # Import the news summary function
-import nltk
 from textblob import TextBlob
-from newspaper import Article
 from urllib.parse import urlparse
 
-# Add the get_news_summary function
-def setup_nltk():
-    """Download required NLTK data"""
-    try:
-        nltk.data.find('tokenizers/punkt')
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        print("Downloading required NLTK data...")
-        nltk.download('punkt')
-        nltk.download('stopwords')
+from news_records import SearchHit, ArticleDetails, ComprehensiveArticle, dumps, NO_TITLE, NO_SUMMARY
+from article_store import ArticleStore
+from document_extractor import ExtractedDocument, extract_document, extractive_summary, setup_nltk
+from summary_router import SummaryRouter, tier_for_model
 
 def resolve_redirected_url(url: str) -> str:
     """
@@ -56,71 +48,52 @@ def resolve_redirected_url(url: str) -> str:
     return final_url
 
 
-def get_news_summary(url, summary_sentences=3, return_json=False):
+def fetch_news_document(url, headers=None):
     """
-    Generate a summary from a news article URL and return as dict
+    Resolve a news URL and fetch it once into an ExtractedDocument
     
-    Args:
-        url (str): The news article URL
-        summary_sentences (int): Number of sentences in the summary (default: 3)
-        return_json (bool): If True, returns JSON string; if False, returns dict
-    
-    Returns:
-        dict: Dictionary containing article summary and metadata
+    The returned document can be passed to summarize_document and to
+    WebScraperSummarizer.process_document without downloading the page again.
     """
     # Setup NLTK if needed
     setup_nltk()
     final_url = resolve_redirected_url(url)
     print(f"Resolved URL: {final_url}")
+    
+    # Validate URL
+    parsed_url = urlparse(final_url)
+    if not parsed_url.scheme or not parsed_url.netloc:
+        return ExtractedDocument(url=final_url, error='Invalid URL format')
+    
+    return extract_document(final_url, headers=headers)
+
+
+def summarize_document(document, summary_sentences=3):
+    """
+    Build the get_news_summary result dict from an extracted document
+    
+    Args:
+        document (ExtractedDocument): Document from extract_document
+        summary_sentences (int): Number of sentences in the TextBlob summary
+    
+    Returns:
+        dict: Dictionary containing article summary and metadata
+    """
+    url = document.final_url or document.url
+    if document.error:
+        return {
+            'success': False,
+            'error': document.error,
+            'url': url,
+            'timestamp': datetime.now().isoformat()
+        }
+    
     try:
-        # Validate URL
-        parsed_url = urlparse(final_url)
-        if not parsed_url.scheme or not parsed_url.netloc:
-            error_result = {
-                'success': False,
-                'error': 'Invalid URL format',
-                'url': final_url,
-                'timestamp': datetime.now().isoformat()
-            }
-            return json.dumps(error_result, indent=2) if return_json else error_result
-        
-        # Initialize and download article
-        article = Article(final_url)
-        article.download()
-        article.parse()
-        
-        # Check if article was successfully parsed
-        if not article.text:
-            error_result = {
-                'success': False,
-                'error': 'Could not extract text from the article',
-                'url': final_url,
-                'timestamp': datetime.now().isoformat()
-            }
-            return json.dumps(error_result, indent=2) if return_json else error_result
-        
-        # Use newspaper3k's built-in summarization
-        article.nlp()
-        newspaper_summary = article.summary
-        
-        # Alternative summary using TextBlob and NLTK
-        blob = TextBlob(article.text)
-        sentences = blob.sentences
-        
         # Simple extractive summarization - get top sentences
-        if len(sentences) <= summary_sentences:
-            textblob_summary = str(blob)
-        else:
-            # Get sentences from different parts of the article
-            step = len(sentences) // summary_sentences
-            selected_sentences = []
-            for i in range(0, len(sentences), step):
-                if len(selected_sentences) < summary_sentences:
-                    selected_sentences.append(str(sentences[i]))
-            textblob_summary = ' '.join(selected_sentences)
+        textblob_summary = extractive_summary(document, summary_sentences)
         
         # Sentiment analysis using TextBlob
-        sentiment = blob.sentiment
+        sentiment = TextBlob(document.text).sentiment
         
         # Determine sentiment label
         sentiment_label = "neutral"
@@ -133,20 +106,20 @@ def get_news_summary(url, summary_sentences=3, return_json=False):
         objectivity_label = "objective" if sentiment.subjectivity < 0.5 else "subjective"
         
         # Prepare successful result
-        result = {
+        return {
             'success': True,
-            'url': final_url,
+            'url': url,
             'timestamp': datetime.now().isoformat(),
             'article': {
-                'title': article.title or 'No title found',
-                'authors': article.authors or [],
-                'publish_date': article.publish_date.isoformat() if article.publish_date else None,
-                'word_count': len(article.text.split()),
-                'top_image': article.top_image or None
+                'title': document.title or NO_TITLE,
+                'authors': document.authors,
+                'publish_date': document.publish_date,
+                'word_count': document.word_count,
+                'top_image': document.top_image
             },
             'summaries': {
-                'newspaper3k': newspaper_summary or 'No summary generated',
-                'textblob': textblob_summary or 'No summary generated'
+                'newspaper3k': document.newspaper_summary or NO_SUMMARY,
+                'textblob': textblob_summary or NO_SUMMARY
             },
             'sentiment_analysis': {
                 'polarity': round(sentiment.polarity, 3),
@@ -154,23 +127,45 @@ def get_news_summary(url, summary_sentences=3, return_json=False):
                 'sentiment_label': sentiment_label,
                 'objectivity_label': objectivity_label
             },
-            'keywords': article.keywords[:10] if hasattr(article, 'keywords') and article.keywords else []
+            'keywords': document.keywords
         }
         
-        return json.dumps(result, indent=2, default=str) if return_json else result
-        
     except Exception as e:
-        error_result = {
+        return {
             'success': False,
             'error': str(e),
-            'url': final_url,
+            'url': url,
             'timestamp': datetime.now().isoformat()
         }
-        return json.dumps(error_result, indent=2) if return_json else error_result
+
+
+def get_news_summary(url, summary_sentences=3, return_json=False):
+    """
+    Generate a summary from a news article URL and return as dict
+    
+    Args:
+        url (str): The news article URL
+        summary_sentences (int): Number of sentences in the summary (default: 3)
+        return_json (bool): If True, returns JSON string; if False, returns dict
+    
+    Returns:
+        dict: Dictionary containing article summary and metadata
+    """
+    result = summarize_document(fetch_news_document(url), summary_sentences)
+    return json.dumps(result, indent=2, default=str) if return_json else result
 
 class ComprehensiveNewsScraper:
-    def __init__(self, headless=True):
-        """Initialize the comprehensive news scraper"""
+    def __init__(self, headless=True, store=None, summarizer=None):
+        """
+        Initialize the comprehensive news scraper
+        
+        Results are upserted into store if given. If summarizer (a
+        WebScraperSummarizer or SummaryRouter) is given, each article also
+        gets a model summary built from the same fetched document. A
+        SummaryRouter is fed through its queue so it sees the run's backlog.
+        """
+        self.store = store
+        self.summarizer = summarizer
         self.chrome_options = Options()
         if headless:
             self.chrome_options.add_argument("--headless")
@@ -198,7 +193,7 @@ class ComprehensiveNewsScraper:
             max_articles (int): Maximum number of articles to scrape
         
         Returns:
-            list: List of dictionaries containing basic article data
+            list: List of SearchHit records containing basic article data
         """
         
         # Construct the Google News search URL
@@ -247,16 +242,7 @@ class ComprehensiveNewsScraper:
             articles_data = []
             for i, container in enumerate(article_containers[:max_articles]):
                 
-                article_data = {
-                    'google_news_url': 'URL not found',
-                    'date': 'Date not found',
-                    'author': 'Author not found',
-                    'source_title': 'Source not found',
-                    'source_image_url': 'Image not found',
-                    'content_image_url': 'Content image not found',
-                    'text_content': 'Content not found',
-                    'article_title': 'Title not found'
-                }
+                article_data = SearchHit()
                 
                 # Extract URL
                 url_element = container.find(class_="WwrzSb") or container.find(class_="JtKRv")
@@ -264,11 +250,11 @@ class ComprehensiveNewsScraper:
                     href = url_element.get('href')
                     if href:
                         if href.startswith('./'):
-                            article_data['google_news_url'] = f"https://news.google.com{href[1:]}"
+                            article_data.google_news_url = f"https://news.google.com{href[1:]}"
                         elif href.startswith('/'):
-                            article_data['google_news_url'] = f"https://news.google.com{href}"
+                            article_data.google_news_url = f"https://news.google.com{href}"
                         else:
-                            article_data['google_news_url'] = href
+                            article_data.google_news_url = href
                 
                 # Extract source information
                 source_container = container.find(class_="oovtQ")
@@ -277,11 +263,11 @@ class ComprehensiveNewsScraper:
                     if img_element:
                         img_src = img_element.get('src') or img_element.get('data-src')
                         if img_src:
-                            article_data['source_image_url'] = img_src
+                            article_data.source_image_url = img_src
                     
                     source_text = source_container.get_text(strip=True)
                     if source_text:
-                        article_data['source_title'] = source_text
+                        article_data.source_title = source_text
                 
                 # Extract content image
                 content_image_element = container.find(class_="Quavad vwBmvb")
@@ -295,24 +281,24 @@ class ComprehensiveNewsScraper:
                         
                         if img_src:
                             if img_src.startswith('http'):
-                                article_data['content_image_url'] = img_src
+                                article_data.content_image_url = img_src
                             elif img_src.startswith('//'):
-                                article_data['content_image_url'] = f"https:{img_src}"
+                                article_data.content_image_url = f"https:{img_src}"
                             elif img_src.startswith('./'):
-                                article_data['content_image_url'] = f"https://news.google.com{img_src[1:]}"
+                                article_data.content_image_url = f"https://news.google.com{img_src[1:]}"
                             elif img_src.startswith('/'):
-                                article_data['content_image_url'] = f"https://news.google.com{img_src}"
+                                article_data.content_image_url = f"https://news.google.com{img_src}"
                 
                 # Extract date and author
                 metadata_container = container.find(class_="UOVeFe")
                 if metadata_container:
                     date_element = metadata_container.find(class_="hvbAAd")
                     if date_element:
-                        article_data['date'] = date_element.get_text(strip=True)
+                        article_data.date = date_element.get_text(strip=True)
                     
                     author_element = metadata_container.find(class_="bInasb")
                     if author_element:
-                        article_data['author'] = author_element.get_text(strip=True)
+                        article_data.author = author_element.get_text(strip=True)
                 
                 # Extract article title
                 title_element = (container.find('h3') or 
@@ -320,7 +306,7 @@ class ComprehensiveNewsScraper:
                                container.find(class_="JtKRv") or
                                container.find(class_="mCBkyc"))
                 if title_element:
-                    article_data['article_title'] = title_element.get_text(strip=True)
+                    article_data.article_title = title_element.get_text(strip=True)
                 
                 # Extract text content/summary
                 content_selectors = [
@@ -334,10 +320,10 @@ class ComprehensiveNewsScraper:
                 for selector in content_selectors:
                     content_element = container.select_one(selector)
                     if content_element:
-                        article_data['text_content'] = content_element.get_text(strip=True)
+                        article_data.text_content = content_element.get_text(strip=True)
                         break
                 
-                if article_data['text_content'] == 'Content not found':
+                if article_data.text_content is None:
                     all_text = container.get_text(separator=' ', strip=True)
                     content_parts = []
                     for part in all_text.split():
@@ -346,11 +332,11 @@ class ComprehensiveNewsScraper:
                         content_parts.append(part)
                     
                     if content_parts:
-                        article_data['text_content'] = ' '.join(content_parts)
+                        article_data.text_content = ' '.join(content_parts)
                 
                 articles_data.append(article_data)
                 
-                print(f"Found Article {i+1}: {article_data['article_title']}")
+                print(f"Found Article {i+1}: {article_data.article_title or 'Title not found'}")
             
             return articles_data
             
@@ -376,47 +362,43 @@ class ComprehensiveNewsScraper:
         try:
             print(f"Calling get_news_summary for: {url}")
             
-            # Call the actual get_news_summary function
-            json_result = get_news_summary(url, return_json=False)
-            
-            return json_result
+            return summarize_document(fetch_news_document(url, headers=self.headers))
             
         except Exception as e:
             print(f"Error calling get_news_summary: {str(e)}")
             return None
 
-    def extract_detailed_article_data(self, url, include_full_content=True):
+    def extract_detailed_article_data(self, url, include_full_content=True, priority="normal"):
         """Extract comprehensive article data from URL using external summary function"""
         try:
             print(f"Getting summary from external function for: {url}")
             
-            # Call the external summary function
-            summary_result = self.get_news_summary_from_external(url)
+            # Fetch once, then run the extractive summary on the shared document
+            document = fetch_news_document(url, headers=self.headers)
+            summary_result = summarize_document(document)
             
             if not summary_result or not summary_result.get('success'):
                 print("✗ Failed to get summary from external function")
                 print(summary_result)
                 return None
             
-            # Extract data from the external function result
-            detailed_data = {
-                'final_url': summary_result.get('url', url),
-                'scraped_at': summary_result.get('timestamp', datetime.now().isoformat()),
-                'detailed_title': summary_result.get('article', {}).get('title', 'Title not found'),
-                'detailed_author': summary_result.get('article', {}).get('authors', ['Author not found']),
-                'detailed_publish_date': summary_result.get('article', {}).get('publish_date', 'Date not found'),
-                'word_count': summary_result.get('article', {}).get('word_count', 0),
-                'main_image_url': summary_result.get('article', {}).get('top_image', 'Image not found'),
-                'content_summary': summary_result.get('summaries', {}).get('newspaper3k', 'Summary not available'),
-                'textblob_summary': summary_result.get('summaries', {}).get('textblob', 'TextBlob summary not available'),
-                'sentiment_analysis': summary_result.get('sentiment_analysis', {}),
-                'keywords': summary_result.get('keywords', []),
-                'external_summary_success': True
-            }
-            
             # Add full content flag but don't include actual full content since we're using external summary
+            full_content_note = None
             if include_full_content:
-                detailed_data['full_content_note'] = "Full content extraction skipped - using external summary function"
+                full_content_note = "Full content extraction skipped - using external summary function"
+            
+            # Wrap the external function result in a compact record
+            detailed_data = ArticleDetails.from_summary(summary_result, url, full_content_note)
+            
+            # Model summary reuses the document - no second download or parse
+            if isinstance(self.summarizer, SummaryRouter):
+                # Queued; summarized by run_pending once all articles are fetched
+                self.summarizer.submit(
+                    document, priority=priority,
+                    callback=lambda model_result: self.apply_model_summary(detailed_data, model_result)
+                )
+            elif self.summarizer is not None:
+                self.apply_model_summary(detailed_data, self.summarizer.process_document(document))
             
             return detailed_data
             
@@ -424,7 +406,19 @@ class ComprehensiveNewsScraper:
             print(f"Error extracting detailed article data: {str(e)}")
             return None
 
-    def scrape_comprehensive_news(self, company_name, max_articles=3, extract_full_content=True):
+    def apply_model_summary(self, detailed_data, model_result):
+        """Store a process_document result with the tier and model that produced it"""
+        detailed_data.model_summary = model_result.get('summary')
+        if 'tier' in model_result:
+            detailed_data.summary_tier = model_result['tier']
+            detailed_data.summary_model = model_result.get('model')
+        else:
+            # A plain WebScraperSummarizer - derive the tier from its model
+            detailed_data.summary_model = self.summarizer.model_name
+            detailed_data.summary_tier = tier_for_model(self.summarizer.model_name)
+
+    def scrape_comprehensive_news(self, company_name, max_articles=3, extract_full_content=True,
+                                  high_priority_articles=1):
         """
         Main method to scrape comprehensive news data using external summary function
         
@@ -432,6 +426,8 @@ class ComprehensiveNewsScraper:
             company_name (str): Company name to search for
             max_articles (int): Maximum number of articles to process
             extract_full_content (bool): Flag for compatibility (not used with external summary)
+            high_priority_articles (int): Number of top-ranked Google News hits summarized
+                as high priority (always full BART) when a SummaryRouter is used
         
         Returns:
             dict: Comprehensive news data
@@ -459,29 +455,28 @@ class ComprehensiveNewsScraper:
             print("-"*50)
             
             # Merge basic data
-            comprehensive_article = {
-                'article_id': i + 1,
-                'google_news_data': basic_article,
-                'detailed_data': None,
-                'extraction_success': False
-            }
+            comprehensive_article = ComprehensiveArticle(
+                article_id=i + 1,
+                google_news_data=basic_article
+            )
             
-            if basic_article['google_news_url'] != 'URL not found':
+            if basic_article.google_news_url is not None:
                 # Get the actual article URL
                 try:
-                    actual_url = self.get_redirect_url(basic_article['google_news_url'])
+                    actual_url = self.get_redirect_url(basic_article.google_news_url)
                     print(f"Actual URL: {actual_url}")
                     
                     # Extract detailed content using external summary function
-                    detailed_data = self.extract_detailed_article_data(actual_url, extract_full_content)
+                    priority = "high" if i < high_priority_articles else "normal"
+                    detailed_data = self.extract_detailed_article_data(actual_url, extract_full_content, priority)
                     
                     if detailed_data:
-                        comprehensive_article['detailed_data'] = detailed_data
-                        comprehensive_article['extraction_success'] = True
+                        comprehensive_article.detailed_data = detailed_data
+                        comprehensive_article.extraction_success = True
                         print("✓ Successfully extracted summary using external function")
                         
                         # Print the newspaper3k summary
-                        newspaper_summary = detailed_data.get('content_summary', 'No summary available')
+                        newspaper_summary = detailed_data.content_summary or 'No summary available'
                         print(f"✓ Newspaper3k Summary: {newspaper_summary[:100]}...")
                     else:
                         print("✗ Failed to extract content using external function")
@@ -494,26 +489,36 @@ class ComprehensiveNewsScraper:
             # Add delay between requests
             time.sleep(2)
         
+        # Step 3: Summarize the queued documents as one batch, routed by the batch size
+        if isinstance(self.summarizer, SummaryRouter):
+            print("\nGenerating model summaries...")
+            self.summarizer.run_pending()
+        
         # Compile final result
         result = {
             'search_query': company_name,
             'scraped_at': datetime.now().isoformat(),
             'total_articles_found': len(comprehensive_articles),
-            'successful_extractions': sum(1 for article in comprehensive_articles if article['extraction_success']),
+            'successful_extractions': sum(1 for article in comprehensive_articles if article.extraction_success),
             'summary_method': 'external_get_news_summary_function',
             'articles': comprehensive_articles
         }
         
+        # Persist all articles from this run in one bulk upsert
+        if self.store is not None:
+            stored = self.store.upsert_results(result)
+            print(f"Stored {stored} articles in {self.store.db_path}")
+        
         return result
 
     def save_comprehensive_data(self, data, filename=None):
-        """Save comprehensive data to JSON file"""
+        """Save comprehensive data to JSON file (records are written in the legacy layout)"""
         if filename is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"comprehensive_news_external_summary_{data['search_query'].replace(' ', '_')}_{timestamp}.json"
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(dumps(data))
         
         print(f"\nComprehensive news data saved to: {filename}")
         return filename
@@ -531,6 +536,9 @@ class ComprehensiveNewsScraper:
         print("-"*100)
         
         for article in data['articles']:
+            # Records and previously saved dicts are printed the same way
+            if isinstance(article, ComprehensiveArticle):
+                article = article.to_dict()
             print(f"\nArticle {article['article_id']}:")
             print(f"  Title: {article['google_news_data']['article_title']}")
             print(f"  Source: {article['google_news_data']['source_title']}")
@@ -580,8 +588,16 @@ def main():
     
     print("Note: Using external get_news_summary function for content extraction and summarization")
     
+    store_choice = input("Store results in the local article database? (y/n): ").strip().lower()
+    store = ArticleStore() if store_choice == 'y' else None
+    
+    summarizer = None
+    model_choice = input("Also generate model summaries (routed by article length)? (y/n): ").strip().lower()
+    if model_choice == 'y':
+        summarizer = SummaryRouter()
+    
     # Initialize scraper
-    scraper = ComprehensiveNewsScraper(headless=True)
+    scraper = ComprehensiveNewsScraper(headless=True, store=store, summarizer=summarizer)
     
     # Scrape comprehensive news data
     print(f"\nStarting comprehensive scraping...")
@@ -604,6 +620,9 @@ def main():
         saved_file = scraper.save_comprehensive_data(comprehensive_data, filename)
         print(f"Data saved to: {saved_file}")
     
+    if store is not None:
+        store.close()
+    
     print("\nScraping completed using external summary function!")
 
 if __name__ == "__main__":
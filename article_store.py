@@ -0,0 +1,310 @@
+import argparse
+import json
+import sqlite3
+from datetime import datetime
+
+from news_records import SEARCH_HIT_PLACEHOLDERS, SUMMARY_PLACEHOLDERS
+
+DEFAULT_DB_PATH = "news_articles.db"
+
+# Every filler string the scraper writes (or wrote in older JSON files) for a missing value
+MISSING_VALUE_PLACEHOLDERS = set(SEARCH_HIT_PLACEHOLDERS.values()) | SUMMARY_PLACEHOLDERS | {
+    'Summary not available', 'TextBlob summary not available'
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company TEXT NOT NULL COLLATE NOCASE,
+    -- Google News URL when known (stable across runs), otherwise the article URL
+    url TEXT NOT NULL,
+    final_url TEXT,
+    title TEXT,
+    source TEXT,
+    author TEXT,
+    publish_date TEXT,
+    scraped_at TEXT NOT NULL,
+    summary TEXT,
+    textblob_summary TEXT,
+    keywords TEXT,
+    sentiment_label TEXT,
+    polarity REAL,
+    subjectivity REAL,
+    word_count INTEGER,
+    model_summary TEXT,
+    summary_tier TEXT,
+    summary_model TEXT,
+    UNIQUE (company, url)
+);
+
+CREATE INDEX IF NOT EXISTS idx_articles_company_scraped ON articles (company, scraped_at);
+CREATE INDEX IF NOT EXISTS idx_articles_scraped ON articles (scraped_at);
+CREATE INDEX IF NOT EXISTS idx_articles_sentiment ON articles (sentiment_label, scraped_at);
+
+-- External-content index: every column must match an articles column of the same name
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+    title, summary, textblob_summary, model_summary, keywords,
+    content='articles', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, summary, textblob_summary, model_summary, keywords)
+    VALUES (new.id, new.title, new.summary, new.textblob_summary, new.model_summary, new.keywords);
+END;
+
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary, textblob_summary, model_summary, keywords)
+    VALUES ('delete', old.id, old.title, old.summary, old.textblob_summary, old.model_summary, old.keywords);
+END;
+
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary, textblob_summary, model_summary, keywords)
+    VALUES ('delete', old.id, old.title, old.summary, old.textblob_summary, old.model_summary, old.keywords);
+    INSERT INTO articles_fts (rowid, title, summary, textblob_summary, model_summary, keywords)
+    VALUES (new.id, new.title, new.summary, new.textblob_summary, new.model_summary, new.keywords);
+END;
+"""
+
+UPSERT_SQL = """
+INSERT INTO articles (
+    company, url, final_url, title, source, author, publish_date, scraped_at,
+    summary, textblob_summary, keywords, sentiment_label, polarity, subjectivity, word_count,
+    model_summary, summary_tier, summary_model
+) VALUES (
+    :company, :url, :final_url, :title, :source, :author, :publish_date, :scraped_at,
+    :summary, :textblob_summary, :keywords, :sentiment_label, :polarity, :subjectivity, :word_count,
+    :model_summary, :summary_tier, :summary_model
+)
+ON CONFLICT (company, url) DO UPDATE SET
+    final_url = coalesce(excluded.final_url, articles.final_url),
+    title = coalesce(excluded.title, articles.title),
+    source = excluded.source,
+    author = excluded.author,
+    publish_date = coalesce(excluded.publish_date, articles.publish_date),
+    scraped_at = excluded.scraped_at,
+    summary = coalesce(excluded.summary, articles.summary),
+    textblob_summary = coalesce(excluded.textblob_summary, articles.textblob_summary),
+    keywords = coalesce(excluded.keywords, articles.keywords),
+    sentiment_label = coalesce(excluded.sentiment_label, articles.sentiment_label),
+    polarity = coalesce(excluded.polarity, articles.polarity),
+    subjectivity = coalesce(excluded.subjectivity, articles.subjectivity),
+    word_count = coalesce(excluded.word_count, articles.word_count),
+    model_summary = coalesce(excluded.model_summary, articles.model_summary),
+    summary_tier = coalesce(excluded.summary_tier, articles.summary_tier),
+    summary_model = coalesce(excluded.summary_model, articles.summary_model)
+"""
+
+
+def fts_phrase_query(text):
+    """Quote each word as an FTS5 string so input like 'covid-19' or 'AT&T' is matched literally"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+
+
+def _clean(value):
+    """Map placeholder strings to None"""
+    if value is None or value in MISSING_VALUE_PLACEHOLDERS:
+        return None
+    return value
+
+
+def article_to_row(company, scraped_at, article):
+    """
+    Convert one article from a scrape_comprehensive_news result into a table row
+
+    Accepts ComprehensiveArticle records or the legacy dict layout found in
+    saved JSON files. Articles are keyed on their Google News URL, so a run
+    where extraction failed and one where it succeeded update the same row.
+    Returns None when the article has no usable URL.
+    """
+    if hasattr(article, 'to_dict'):
+        article = article.to_dict()
+
+    news = article.get('google_news_data') or {}
+    detailed = article.get('detailed_data') or {}
+    sentiment = detailed.get('sentiment_analysis') or {}
+
+    final_url = detailed.get('final_url')
+    url = _clean(news.get('google_news_url')) or final_url
+    if not url:
+        return None
+
+    title = _clean(detailed.get('detailed_title')) or _clean(news.get('article_title'))
+    keywords = detailed.get('keywords') or []
+
+    return {
+        'company': company,
+        'url': url,
+        'final_url': final_url,
+        'title': title,
+        'source': _clean(news.get('source_title')),
+        'author': _clean(news.get('author')),
+        'publish_date': detailed.get('detailed_publish_date'),
+        'scraped_at': detailed.get('scraped_at') or scraped_at,
+        'summary': _clean(detailed.get('content_summary')),
+        'textblob_summary': _clean(detailed.get('textblob_summary')),
+        'keywords': ' '.join(keywords) if keywords else None,
+        'sentiment_label': sentiment.get('sentiment_label'),
+        'polarity': sentiment.get('polarity'),
+        'subjectivity': sentiment.get('subjectivity'),
+        'word_count': detailed.get('word_count') if detailed else None,
+        'model_summary': detailed.get('model_summary'),
+        'summary_tier': detailed.get('summary_tier'),
+        'summary_model': detailed.get('summary_model')
+    }
+
+
+class ArticleStore:
+    """Persistent SQLite store for scraped articles with an FTS5 keyword index"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def upsert_results(self, data):
+        """
+        Bulk upsert a scrape_comprehensive_news result in a single transaction
+
+        Returns:
+            int: Number of articles written
+        """
+        company = data['search_query']
+        scraped_at = data.get('scraped_at') or datetime.now().isoformat()
+        rows = [row for row in (article_to_row(company, scraped_at, article)
+                                for article in data.get('articles', [])) if row]
+        if rows:
+            with self.conn:
+                self.conn.executemany(UPSERT_SQL, rows)
+        return len(rows)
+
+    def import_json_files(self, paths):
+        """Import files written by save_comprehensive_data, returns number of articles written"""
+        total = 0
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            count = self.upsert_results(data)
+            print(f"Imported {count} articles from {path}")
+            total += count
+        return total
+
+    def query(self, company=None, since=None, until=None, keyword=None, sentiment=None, limit=50,
+              raw_keyword=False):
+        """
+        Look up stored articles
+
+        Args:
+            company (str): Search query / company name (case-insensitive)
+            since (str): ISO date or datetime, inclusive lower bound on scraped_at
+            until (str): ISO date or datetime, exclusive upper bound on scraped_at
+            keyword (str): Words that must all appear in the title, any summary or keywords
+            sentiment (str): positive, negative or neutral
+            limit (int): Maximum number of rows to return
+            raw_keyword (bool): Pass keyword as full FTS5 query syntax (may raise
+                sqlite3.OperationalError on invalid queries)
+
+        Returns:
+            list: List of article dictionaries, newest first
+        """
+        sql = "SELECT a.* FROM articles a"
+        conditions = []
+        params = []
+
+        if keyword:
+            sql += " JOIN articles_fts f ON f.rowid = a.id"
+            conditions.append("articles_fts MATCH ?")
+            params.append(keyword if raw_keyword else fts_phrase_query(keyword))
+        if company:
+            conditions.append("a.company = ?")
+            params.append(company)
+        if since:
+            conditions.append("a.scraped_at >= ?")
+            params.append(since)
+        if until:
+            conditions.append("a.scraped_at < ?")
+            params.append(until)
+        if sentiment:
+            conditions.append("a.sentiment_label = ?")
+            params.append(sentiment)
+
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY a.scraped_at DESC LIMIT ?"
+        params.append(limit)
+
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+
+def main():
+    """Command line interface for importing and querying the article store"""
+    parser = argparse.ArgumentParser(description="Query or import scraped news articles")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite database path")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="Import saved comprehensive news JSON files")
+    import_parser.add_argument("files", nargs="+")
+
+    query_parser = subparsers.add_parser("query", help="Query stored articles")
+    query_parser.add_argument("--company")
+    query_parser.add_argument("--since", help="ISO date, e.g. 2024-05-01")
+    query_parser.add_argument("--until", help="ISO date, exclusive")
+    query_parser.add_argument("--keyword", help="Words to find in titles, summaries and keywords")
+    query_parser.add_argument("--raw", action="store_true",
+                              help="Treat --keyword as an FTS5 query (AND/OR/NOT, prefix*, NEAR)")
+    query_parser.add_argument("--sentiment", choices=["positive", "negative", "neutral"])
+    query_parser.add_argument("--limit", type=int, default=50)
+    query_parser.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    args = parser.parse_args()
+
+    with ArticleStore(args.db) as store:
+        if args.command == "import":
+            total = store.import_json_files(args.files)
+            print(f"Imported {total} articles into {args.db}")
+            return
+
+        try:
+            results = store.query(
+                company=args.company,
+                since=args.since,
+                until=args.until,
+                keyword=args.keyword,
+                sentiment=args.sentiment,
+                limit=args.limit,
+                raw_keyword=args.raw
+            )
+        except sqlite3.OperationalError as e:
+            print(f"Invalid full-text query {args.keyword!r}: {e}")
+            return
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    print(f"Found {len(results)} articles")
+    print("-" * 50)
+    for row in results:
+        print(f"[{row['scraped_at'][:10]}] {row['company']}: {row['title'] or 'Title not found'}")
+        print(f"  Source: {row['source'] or 'Source not found'}")
+        if row['sentiment_label']:
+            print(f"  Sentiment: {row['sentiment_label']} (polarity: {row['polarity']})")
+        if row['model_summary']:
+            print(f"  Model summary ({row['summary_tier'] or 'unknown tier'}, {row['summary_model'] or 'unknown model'}): "
+                  f"{row['model_summary'][:150]}")
+        print(f"  URL: {row['final_url'] or row['url']}")
+
+
+if __name__ == "__main__":
+    main()
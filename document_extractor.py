@@ -0,0 +1,344 @@
+import codecs
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import List, Optional
+
+import requests
+
+# requests bundles charset_normalizer or chardet - used to guess undeclared encodings
+try:
+    from requests.compat import chardet
+except ImportError:
+    chardet = None
+
+# Content types accepted when fetching article pages
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain')
+
+# Default cap on bytes read per page - larger responses are truncated
+MAX_CONTENT_BYTES = 2 * 1024 * 1024
+
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+
+class ContentTextExtractor(HTMLParser):
+    """
+    Incremental HTML text extractor
+
+    Mirrors the selector priority scrape_content used with BeautifulSoup but
+    works on a stream of chunks without building a parse tree. Only one copy
+    of the text is buffered: text of the highest-priority selector seen so
+    far, or the p/div/span fallback text while no selector has matched.
+    Inline text is concatenated as-is; a space is only inserted at block-level
+    tags, so nested containers no longer duplicate or split their text.
+    """
+
+    SKIP_TAGS = {'script', 'style', 'nav', 'header', 'footer'}
+    VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                 'link', 'meta', 'source', 'track', 'wbr'}
+    BLOCK_TAGS = {'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl',
+                  'dt', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4',
+                  'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre',
+                  'section', 'table', 'td', 'th', 'tr', 'ul'}
+    # (tag, class, id) matchers in the same order as the old CSS selectors:
+    # 'article', 'main', '.content', '#content', '.post', '.entry', 'div.text', 'div.body'
+    CONTENT_SELECTORS = [
+        ('article', None, None), ('main', None, None), (None, 'content', None),
+        (None, None, 'content'), (None, 'post', None), (None, 'entry', None),
+        ('div', 'text', None), ('div', 'body', None)
+    ]
+    FALLBACK_TAGS = {'p', 'div', 'span'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        # Stack of (tag, skipped, matched selector indexes, is fallback tag)
+        self.stack = []
+        self.skip_depth = 0
+        self.selector_depth = [0] * len(self.CONTENT_SELECTORS)
+        self.fallback_depth = 0
+        # Index of the highest-priority selector that has produced text
+        self.best_selector = None
+        self.parts = []
+        self.break_pending = False
+
+    def _matching_selectors(self, tag, attrs):
+        classes = set()
+        element_id = None
+        for name, value in attrs:
+            if name == 'class' and value:
+                classes.update(value.split())
+            elif name == 'id':
+                element_id = value
+        matches = []
+        for i, (sel_tag, sel_class, sel_id) in enumerate(self.CONTENT_SELECTORS):
+            if sel_tag and sel_tag != tag:
+                continue
+            if sel_class and sel_class not in classes:
+                continue
+            if sel_id and sel_id != element_id:
+                continue
+            matches.append(i)
+        return matches
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.BLOCK_TAGS:
+            self.break_pending = True
+        if tag in self.VOID_TAGS:
+            return
+        skipped = tag in self.SKIP_TAGS
+        matches = self._matching_selectors(tag, attrs)
+        is_fallback = tag in self.FALLBACK_TAGS
+        self.stack.append((tag, skipped, matches, is_fallback))
+        self.skip_depth += skipped
+        for i in matches:
+            self.selector_depth[i] += 1
+        self.fallback_depth += is_fallback
+
+    def handle_endtag(self, tag):
+        if tag in self.BLOCK_TAGS:
+            self.break_pending = True
+        # Malformed pages leave tags open - close everything up to the match
+        for pos in range(len(self.stack) - 1, -1, -1):
+            if self.stack[pos][0] == tag:
+                while len(self.stack) > pos:
+                    _, skipped, matches, is_fallback = self.stack.pop()
+                    self.skip_depth -= skipped
+                    for i in matches:
+                        self.selector_depth[i] -= 1
+                    self.fallback_depth -= is_fallback
+                return
+
+    def handle_data(self, data):
+        if self.skip_depth:
+            return
+        if not data.strip():
+            self.break_pending = True
+            return
+
+        active = next((i for i, depth in enumerate(self.selector_depth) if depth), None)
+        if active is not None:
+            if self.best_selector is None or active < self.best_selector:
+                # A higher-priority selector matched - drop what was buffered so far
+                self.best_selector = active
+                self.parts = []
+            elif active > self.best_selector:
+                return
+        elif self.best_selector is not None or not self.fallback_depth:
+            return
+
+        if self.break_pending and self.parts:
+            self.parts.append(' ')
+        self.break_pending = False
+        self.parts.append(data)
+
+    def get_text(self):
+        """Return text for the highest-priority selector that matched, else the fallback text"""
+        return "".join(self.parts)
+
+
+@dataclass(slots=True)
+class ExtractedDocument:
+    """Clean text, metadata and sentences for one fetched article"""
+    url: str
+    final_url: Optional[str] = None
+    fetched_at: Optional[str] = None
+    title: Optional[str] = None
+    authors: List[str] = field(default_factory=list)
+    publish_date: Optional[str] = None
+    top_image: Optional[str] = None
+    text: str = ""
+    # Filled in by split_sentences the first time they are needed
+    sentences: Optional[List[str]] = None
+    keywords: List[str] = field(default_factory=list)
+    newspaper_summary: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def word_count(self):
+        return len(self.text.split())
+
+
+def setup_nltk():
+    """Download required NLTK data"""
+    import nltk
+    try:
+        nltk.data.find('tokenizers/punkt')
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        print("Downloading required NLTK data...")
+        nltk.download('punkt')
+        nltk.download('stopwords')
+
+
+def split_sentences(document):
+    """Split the document into sentences with TextBlob (needs NLTK punkt), caching the result"""
+    if document.sentences is None:
+        from textblob import TextBlob
+        setup_nltk()
+        document.sentences = [str(sentence) for sentence in TextBlob(document.text).sentences]
+    return document.sentences
+
+
+def extractive_summary(document, summary_sentences=3):
+    """Pick sentences spread evenly through the document (the TextBlob summary)"""
+    sentences = split_sentences(document)
+    if len(sentences) <= summary_sentences:
+        return document.text
+
+    # Get sentences from different parts of the article
+    step = len(sentences) // summary_sentences
+    selected_sentences = []
+    for i in range(0, len(sentences), step):
+        if len(selected_sentences) < summary_sentences:
+            selected_sentences.append(sentences[i])
+    return ' '.join(selected_sentences)
+
+
+def detect_encoding(response, head):
+    """
+    Pick the page encoding: HTTP charset, then <meta charset>, then a guess from the first bytes
+
+    requests assumes ISO-8859-1 whenever the header has no charset, so the
+    header is only trusted when it names one explicitly.
+    """
+    candidates = []
+    if 'charset=' in response.headers.get('Content-Type', ''):
+        candidates.append(response.encoding)
+    match = META_CHARSET_RE.search(head)
+    if match:
+        candidates.append(match.group(1).decode('ascii', 'ignore'))
+    candidates.append(chardet.detect(bytes(head)).get('encoding') if chardet else None)
+
+    for encoding in candidates:
+        if not encoding:
+            continue
+        try:
+            return codecs.lookup(encoding).name
+        except LookupError:
+            continue
+    return 'utf-8'
+
+
+def fetch_html(url, headers=None, max_bytes=MAX_CONTENT_BYTES, extractor=None):
+    """
+    Stream a page, reading at most max_bytes
+
+    With an extractor, decoded chunks are fed to it as they arrive and no HTML
+    is kept: returns (final_url, None). Without one, the raw bytes are buffered
+    and decoded once at the end: returns (final_url, html).
+    Raises requests.RequestException on network errors and ValueError on
+    unsupported content types.
+    """
+    with requests.get(url, headers=headers or DEFAULT_HEADERS, timeout=10, stream=True) as response:
+        response.raise_for_status()
+
+        content_type = response.headers.get('Content-Type', 'text/html').split(';')[0].strip().lower()
+        if content_type not in HTML_CONTENT_TYPES:
+            raise ValueError(f"unsupported content type '{content_type}'")
+
+        body = bytearray()
+        decoder = None
+        bytes_read = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunk = chunk[:max_bytes - bytes_read]
+            bytes_read += len(chunk)
+            if extractor is None:
+                body.extend(chunk)
+            else:
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder(detect_encoding(response, chunk))(errors='replace')
+                extractor.feed(decoder.decode(chunk))
+            if bytes_read >= max_bytes:
+                print(f"Page exceeds {max_bytes} bytes, truncating")
+                break
+
+        if extractor is not None:
+            if decoder is not None:
+                extractor.feed(decoder.decode(b'', final=True))
+            extractor.close()
+            return response.url, None
+
+        html = body.decode(detect_encoding(response, body[:64 * 1024]), errors='replace')
+        del body
+        return response.url, html
+
+
+def extract_document(url, headers=None, max_bytes=MAX_CONTENT_BYTES, nlp=True):
+    """
+    Fetch an article once and extract everything both summarization paths need
+
+    With nlp=False only the streaming ContentTextExtractor runs: no HTML is
+    kept, no parse tree is built, and only requests is needed. This is all
+    the abstractive (BART) path uses.
+
+    With nlp=True (the newspaper3k path) up to max_bytes of HTML is held and
+    newspaper3k builds its lxml tree from it for text, metadata, keywords and
+    its summary. The streaming extractor is only run over the HTML when
+    newspaper3k finds no text. Sentences are split lazily by split_sentences.
+
+    Args:
+        url (str): Article URL
+        headers (dict): Request headers (defaults to a desktop browser)
+        max_bytes (int): Maximum number of bytes to read from the page
+        nlp (bool): Parse with newspaper3k and run its keyword extraction and summary
+
+    Returns:
+        ExtractedDocument: Extracted document (error is set on failure)
+    """
+    document = ExtractedDocument(url=url, fetched_at=datetime.now().isoformat())
+    try:
+        if not nlp:
+            extractor = ContentTextExtractor()
+            document.final_url, _ = fetch_html(url, headers, max_bytes, extractor)
+            document.text = re.sub(r'\s+', ' ', extractor.get_text()).strip()
+            del extractor
+        else:
+            from newspaper import Article
+
+            document.final_url, html = fetch_html(url, headers, max_bytes)
+            article = Article(document.final_url)
+            article.download(input_html=html)
+            article.parse()
+
+            document.text = article.text
+            if not document.text:
+                extractor = ContentTextExtractor()
+                extractor.feed(html)
+                extractor.close()
+                document.text = re.sub(r'\s+', ' ', extractor.get_text()).strip()
+                del extractor
+            del html
+
+            document.title = article.title or None
+            document.authors = article.authors or []
+            document.publish_date = article.publish_date.isoformat() if article.publish_date else None
+            document.top_image = article.top_image or None
+
+            if document.text:
+                # Keywords and the newspaper3k summary are optional - keep the text if nlp() fails
+                try:
+                    setup_nltk()
+                    article.nlp()
+                    document.keywords = article.keywords[:10] if article.keywords else []
+                    document.newspaper_summary = article.summary or None
+                except Exception as e:
+                    print(f"Skipping newspaper3k keywords and summary: {str(e)}")
+            del article
+
+        if not document.text:
+            document.error = 'Could not extract text from the article'
+        return document
+
+    except requests.exceptions.RequestException as e:
+        document.error = f"Error fetching URL: {str(e)}"
+        return document
+    except Exception as e:
+        document.error = f"Error parsing content: {str(e)}"
+        return document
@@ -0,0 +1,207 @@
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import List, Optional
+import json
+
+# orjson is optional - fall back to the stdlib encoder when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Placeholder strings used by the original dict layout for missing search hit fields
+SEARCH_HIT_PLACEHOLDERS = {
+    'google_news_url': 'URL not found',
+    'date': 'Date not found',
+    'author': 'Author not found',
+    'source_title': 'Source not found',
+    'source_image_url': 'Image not found',
+    'content_image_url': 'Content image not found',
+    'text_content': 'Content not found',
+    'article_title': 'Title not found'
+}
+
+# Placeholder strings get_news_summary writes for a missing title or summary
+NO_TITLE = 'No title found'
+NO_SUMMARY = 'No summary generated'
+SUMMARY_PLACEHOLDERS = {NO_TITLE, NO_SUMMARY}
+
+
+def none_if_placeholder(value):
+    """Map get_news_summary placeholder strings to None"""
+    return None if value in SUMMARY_PLACEHOLDERS else value
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """Basic article data scraped from a Google News search page"""
+    google_news_url: Optional[str] = None
+    date: Optional[str] = None
+    author: Optional[str] = None
+    source_title: Optional[str] = None
+    source_image_url: Optional[str] = None
+    content_image_url: Optional[str] = None
+    text_content: Optional[str] = None
+    article_title: Optional[str] = None
+
+    def to_dict(self):
+        """Return the legacy dict layout with placeholder strings for missing values"""
+        return {
+            name: getattr(self, name) if getattr(self, name) is not None else placeholder
+            for name, placeholder in SEARCH_HIT_PLACEHOLDERS.items()
+        }
+
+
+@dataclass(slots=True)
+class Sentiment:
+    """TextBlob sentiment scores and labels for an article"""
+    polarity: float
+    subjectivity: float
+    sentiment_label: str
+    objectivity_label: str
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build from a get_news_summary 'sentiment_analysis' dict, or None if empty"""
+        if not data:
+            return None
+        return cls(
+            polarity=data.get('polarity', 0),
+            subjectivity=data.get('subjectivity', 0),
+            sentiment_label=data.get('sentiment_label', 'unknown'),
+            objectivity_label=data.get('objectivity_label', 'unknown')
+        )
+
+    def to_dict(self):
+        return {
+            'polarity': self.polarity,
+            'subjectivity': self.subjectivity,
+            'sentiment_label': self.sentiment_label,
+            'objectivity_label': self.objectivity_label
+        }
+
+
+@dataclass(slots=True)
+class ArticleDetails:
+    """Detailed article data taken from a get_news_summary result"""
+    final_url: str
+    scraped_at: str
+    title: Optional[str] = None
+    authors: List[str] = field(default_factory=list)
+    publish_date: Optional[str] = None
+    word_count: int = 0
+    main_image_url: Optional[str] = None
+    content_summary: Optional[str] = None
+    textblob_summary: Optional[str] = None
+    sentiment: Optional[Sentiment] = None
+    keywords: List[str] = field(default_factory=list)
+    full_content_note: Optional[str] = None
+    model_summary: Optional[str] = None
+    summary_tier: Optional[str] = None
+    summary_model: Optional[str] = None
+
+    @classmethod
+    def from_summary(cls, summary_result, url, full_content_note=None):
+        """Copy the fields of a successful get_news_summary dict into a record (placeholders become None)"""
+        article = summary_result.get('article', {})
+        summaries = summary_result.get('summaries', {})
+        return cls(
+            final_url=summary_result.get('url', url),
+            scraped_at=summary_result.get('timestamp') or datetime.now().isoformat(),
+            title=none_if_placeholder(article.get('title')),
+            authors=article.get('authors') or [],
+            publish_date=article.get('publish_date'),
+            word_count=article.get('word_count', 0),
+            main_image_url=article.get('top_image'),
+            content_summary=none_if_placeholder(summaries.get('newspaper3k')),
+            textblob_summary=none_if_placeholder(summaries.get('textblob')),
+            sentiment=Sentiment.from_dict(summary_result.get('sentiment_analysis')),
+            keywords=summary_result.get('keywords') or [],
+            full_content_note=full_content_note
+        )
+
+    def to_dict(self):
+        """Return the legacy 'detailed_data' dict layout (placeholders as get_news_summary wrote them)"""
+        data = {
+            'final_url': self.final_url,
+            'scraped_at': self.scraped_at,
+            'detailed_title': self.title if self.title is not None else NO_TITLE,
+            'detailed_author': self.authors,
+            'detailed_publish_date': self.publish_date,
+            'word_count': self.word_count,
+            'main_image_url': self.main_image_url,
+            'content_summary': self.content_summary if self.content_summary is not None else NO_SUMMARY,
+            'textblob_summary': self.textblob_summary if self.textblob_summary is not None else NO_SUMMARY,
+            'sentiment_analysis': self.sentiment.to_dict() if self.sentiment else {},
+            'keywords': self.keywords,
+            'external_summary_success': True
+        }
+        if self.full_content_note is not None:
+            data['full_content_note'] = self.full_content_note
+        if self.model_summary is not None:
+            data['model_summary'] = self.model_summary
+        if self.summary_tier is not None:
+            data['summary_tier'] = self.summary_tier
+        if self.summary_model is not None:
+            data['summary_model'] = self.summary_model
+        return data
+
+
+@dataclass(slots=True)
+class ComprehensiveArticle:
+    """A search hit together with its (optional) detailed extraction"""
+    article_id: int
+    google_news_data: SearchHit
+    detailed_data: Optional[ArticleDetails] = None
+    extraction_success: bool = False
+
+    def to_dict(self):
+        return {
+            'article_id': self.article_id,
+            'google_news_data': self.google_news_data.to_dict(),
+            'detailed_data': self.detailed_data.to_dict() if self.detailed_data else None,
+            'extraction_success': self.extraction_success
+        }
+
+
+def to_legacy(obj):
+    """JSON 'default' hook - converts records to the legacy dict layout"""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def to_fields(obj):
+    """JSON 'default' hook - converts records to a dict of their fields (None kept as null)"""
+    if hasattr(obj, '__dataclass_fields__'):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data, indent=True, legacy=True):
+    """
+    Serialize scraper output (plain dicts and/or records) to UTF-8 JSON bytes
+
+    Uses orjson when available, otherwise the stdlib json module.
+
+    With legacy=True (the default) the output matches the layout previously
+    written by json.dump(..., indent=2). Each record is first turned into a
+    dict tree by its Python to_dict() adapter, so in this mode orjson only
+    speeds up the encoding step, not the record conversion. With legacy=False
+    orjson serializes the records natively by field name, with null for
+    missing values - use this where the placeholder layout is not needed.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if legacy:
+            # Dataclasses are passed through to to_legacy so placeholders are kept
+            option |= orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=to_legacy, option=option)
+
+    return json.dumps(
+        data, default=to_legacy if legacy else to_fields,
+        indent=2 if indent else None, ensure_ascii=False
+    ).encode('utf-8')
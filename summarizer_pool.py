@@ -0,0 +1,163 @@
+import gc
+import multiprocessing
+import os
+
+from document_extractor import MAX_CONTENT_BYTES
+
+# Summarizer loaded by the parent before forking; inherited copy-on-write by workers
+_SUMMARIZER = None
+# Barrier that makes every worker take exactly one smoke job
+_SMOKE_BARRIER = None
+
+SMOKE_TEXT = (
+    "The company said on Monday that it had raised new funding from existing investors. "
+    "The money will be used to hire engineers and expand into new markets next year."
+)
+# Seconds to wait for the workers to finish the smoke inference before giving up
+SMOKE_TIMEOUT = 300
+
+
+def _init_worker(threads_per_worker):
+    """Limit torch threads in each worker so workers don't oversubscribe the CPU"""
+    import torch
+    torch.set_num_threads(threads_per_worker)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set once, before any parallel work has started
+        pass
+
+
+def _process_url(url, summary_length):
+    return _SUMMARIZER.process_url(url, summary_length)
+
+
+def _smoke_job(timeout):
+    """Run a tiny inference in a worker; returns (pid, torch threads)"""
+    import torch
+    _SUMMARIZER.summarizer(SMOKE_TEXT, max_length=20, min_length=5, do_sample=False)
+    # Hold this worker until every worker has run one inference
+    _SMOKE_BARRIER.wait(timeout)
+    return os.getpid(), torch.get_num_threads()
+
+
+class SummarizerPool:
+    """
+    Pre-forked pool of summarization workers sharing one copy of the model
+
+    The parent loads WebScraperSummarizer once and then forks the workers,
+    so the model weights are shared copy-on-write instead of every process
+    loading its own copy of BART. Requires the 'fork' start method (Linux/macOS).
+
+    The parent loads the model with a single torch thread and never runs
+    inference, and check_workers() runs one inference in every worker right
+    after the fork, so a worker that hangs in OpenMP (libgomp is not fork-safe
+    once the parent has started a thread team) fails at startup instead of on
+    the first real job. The GC heap stays frozen until close(); workers the
+    pool respawns after a crash are forked from the same frozen heap.
+    """
+
+    def __init__(self, workers=None, threads_per_worker=None,
+                 model_name="facebook/bart-large-cnn", max_content_bytes=MAX_CONTENT_BYTES):
+        global _SUMMARIZER, _SMOKE_BARRIER
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("SummarizerPool needs the 'fork' start method to share model weights")
+
+        cpu_count = os.cpu_count() or 1
+        self.workers = workers or cpu_count
+        self.threads_per_worker = threads_per_worker or max(1, cpu_count // self.workers)
+
+        # Load the model once in the parent with one torch thread, so no OpenMP
+        # thread team exists when the workers are forked
+        import torch
+        torch.set_num_threads(1)
+        from summarryGeneratorwithnewslink import WebScraperSummarizer
+        _SUMMARIZER = WebScraperSummarizer(max_content_bytes=max_content_bytes, model_name=model_name)
+        _SUMMARIZER.summarizer.model.eval()
+
+        # Move everything allocated so far out of the GC's reach so collections
+        # in the workers don't touch (and copy) the shared pages
+        gc.collect()
+        gc.freeze()
+
+        print(f"Starting {self.workers} workers with {self.threads_per_worker} torch threads each...")
+        context = multiprocessing.get_context("fork")
+        _SMOKE_BARRIER = context.Barrier(self.workers)
+        self.pool = context.Pool(
+            processes=self.workers,
+            initializer=_init_worker,
+            initargs=(self.threads_per_worker,),
+            maxtasksperchild=None
+        )
+        self.check_workers()
+
+    def check_workers(self, timeout=SMOKE_TIMEOUT):
+        """
+        Smoke test: run one inference in every worker with its configured thread count
+
+        Returns:
+            list: (pid, torch threads) for each worker
+
+        Raises:
+            RuntimeError: if the workers hang or fail; the pool is terminated
+        """
+        jobs = [self.pool.apply_async(_smoke_job, (timeout,)) for _ in range(self.workers)]
+        try:
+            return [job.get(timeout) for job in jobs]
+        except Exception as e:
+            self.pool.terminate()
+            gc.unfreeze()
+            raise RuntimeError(
+                f"Summarizer workers failed the startup inference ({type(e).__name__}: {e}); "
+                f"try threads_per_worker=1"
+            ) from e
+
+    def submit(self, url, summary_length="medium"):
+        """
+        Queue a URL for summarization
+
+        Returns:
+            AsyncResult: call .get() for the process_url result dict
+        """
+        return self.pool.apply_async(_process_url, (url, summary_length))
+
+    def map(self, urls, summary_length="medium"):
+        """Summarize several URLs in parallel, returning results in input order"""
+        return self.pool.starmap(_process_url, [(url, summary_length) for url in urls])
+
+    def close(self):
+        """Wait for queued jobs to finish and stop the workers"""
+        self.pool.close()
+        self.pool.join()
+        gc.unfreeze()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    """Example usage"""
+    test_urls = [
+        "https://www.moneycontrol.com/news/business/startup/wellness-startup-biopeak-raises-3-5-million-in-seed-funding-from-ranjan-pai-office-accel-s-prashanth-prakash-others-13103236.html"
+    ]
+
+    with SummarizerPool(workers=2) as pool:
+        results = pool.map(test_urls, summary_length="medium")
+
+    for result in results:
+        print(f"\n{'='*60}")
+        if result.get("error"):
+            print(f"Failed to process {result['url']}")
+            print(f"Error: {result['error']}")
+        else:
+            print(f"URL: {result['url']}")
+            print(f"Compression: {result['compression_ratio']}")
+            print(f"\nSummary:\n{result['summary']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,57 +1,26 @@
-import requests
-from bs4 import BeautifulSoup
 from transformers import pipeline
-import re
 import warnings
 warnings.filterwarnings("ignore")
 
+from document_extractor import extract_document, MAX_CONTENT_BYTES
+
 class WebScraperSummarizer:
-    def __init__(self):
+    def __init__(self, max_content_bytes=MAX_CONTENT_BYTES, model_name="facebook/bart-large-cnn"):
         """Initialize the web scraper with AI summarization capabilities"""
-        print("Loading AI model for summarization...")
+        self.max_content_bytes = max_content_bytes
+        self.model_name = model_name
+        print(f"Loading AI model for summarization ({model_name})...")
         self.summarizer = pipeline(
             "summarization", 
-            model="facebook/bart-large-cnn",
+            model=model_name,
             device=-1  # Use CPU
         )
         print("Model loaded successfully!")
 
     def scrape_content(self, url):
-        """Scrape text content from the given URL"""
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            for script in soup(["script", "style", "nav", "header", "footer"]):
-                script.decompose()
-
-            text_content = ""
-            content_selectors = [
-                'article', 'main', '.content', '#content', 
-                '.post', '.entry', 'div.text', 'div.body'
-            ]
-
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    text_content = " ".join([elem.get_text() for elem in elements])
-                    break
-
-            if not text_content:
-                paragraphs = soup.find_all(['p', 'div', 'span'])
-                text_content = " ".join([p.get_text() for p in paragraphs])
-
-            text_content = re.sub(r'\\s+', ' ', text_content).strip()
-            return text_content
-
-        except requests.exceptions.RequestException as e:
-            return f"Error fetching URL: {str(e)}"
-        except Exception as e:
-            return f"Error parsing content: {str(e)}"
+        """Scrape text content from the given URL, reading at most max_content_bytes"""
+        document = extract_document(url, max_bytes=self.max_content_bytes, nlp=False)
+        return document.error or document.text
 
     def chunk_text(self, text, max_chunk_size=1000):
         """Split text into chunks for processing"""
@@ -120,16 +89,21 @@ class WebScraperSummarizer:
     def process_url(self, url, summary_length="medium"):
         """Main method to scrape URL and return summary"""
         print(f"Scraping content from: {url}")
-        content = self.scrape_content(url)
+        document = extract_document(url, max_bytes=self.max_content_bytes, nlp=False)
+        return self.process_document(document, summary_length)
 
-        if content.startswith("Error"):
+    def process_document(self, document, summary_length="medium"):
+        """Summarize an already extracted document (see document_extractor.extract_document)"""
+        url = document.url
+        if document.error:
             return {
                 "url": url,
-                "error": content,
+                "error": document.error,
                 "summary": None,
                 "original_length": 0
             }
 
+        content = document.text
         print(f"Scraped {len(content)} characters")
 
         length_params = {
@@ -0,0 +1,208 @@
+import queue
+from dataclasses import dataclass
+
+from document_extractor import extract_document, extractive_summary, MAX_CONTENT_BYTES
+
+# Summarization tiers, cheapest first
+TIER_EXTRACTIVE = "extractive"
+TIER_DISTILLED = "distilled"
+TIER_FULL = "full"
+TIERS = [TIER_EXTRACTIVE, TIER_DISTILLED, TIER_FULL]
+
+# Recorded when summarization failed (e.g. the model could not be loaded)
+TIER_FAILED = "failed"
+
+EXTRACTIVE_MODEL = "newspaper3k/textblob"
+TIER_MODELS = {
+    TIER_DISTILLED: "sshleifer/distilbart-cnn-12-6",
+    TIER_FULL: "facebook/bart-large-cnn"
+}
+
+# Order in which a batch is processed
+PRIORITY_ORDER = {"high": 0, "normal": 1, "low": 2}
+
+
+def tier_for_model(model_name):
+    """Return the tier a model belongs to, or None for models outside TIER_MODELS"""
+    for tier, name in TIER_MODELS.items():
+        if name == model_name:
+            return tier
+    return None
+
+
+@dataclass(slots=True)
+class RouterConfig:
+    """Thresholds used by SummaryRouter to pick a tier"""
+    # Articles shorter than this (in words) use the extractive path
+    short_word_limit: int = 300
+    # Articles at least this long (in words) use full BART
+    long_word_limit: int = 900
+    # Pending queue size at which normal articles drop one tier
+    queue_soft_limit: int = 10
+    # Pending queue size at which normal articles drop to extractive
+    queue_hard_limit: int = 25
+    # Number of sentences in extractive summaries
+    extractive_sentences: int = 3
+
+
+class SummaryRouter:
+    """
+    Route documents to the cheapest summarization tier that fits them
+
+    - low priority or short articles: extractive (newspaper3k/TextBlob)
+    - medium articles: distilled BART
+    - high priority or long articles: full BART
+
+    When the pending queue backs up, normal-priority articles are shifted to
+    cheaper tiers; high-priority articles always keep full BART. Models are
+    loaded lazily, the first time a tier is used; a tier whose model fails to
+    load is not retried.
+    """
+
+    def __init__(self, config=None, max_content_bytes=MAX_CONTENT_BYTES):
+        self.config = config or RouterConfig()
+        self.max_content_bytes = max_content_bytes
+        self.summarizers = {}
+        self.load_errors = {}
+        self.pending = queue.Queue()
+
+    def get_summarizer(self, tier):
+        """Return the WebScraperSummarizer for a model tier, loading it on first use"""
+        if tier in self.load_errors:
+            raise RuntimeError(f"{TIER_MODELS[tier]} failed to load: {self.load_errors[tier]}")
+        if tier not in self.summarizers:
+            try:
+                # Imported here so transformers is only loaded when a model tier is used
+                from summarryGeneratorwithnewslink import WebScraperSummarizer
+                self.summarizers[tier] = WebScraperSummarizer(
+                    max_content_bytes=self.max_content_bytes,
+                    model_name=TIER_MODELS[tier]
+                )
+            except Exception as e:
+                self.load_errors[tier] = str(e)
+                raise
+        return self.summarizers[tier]
+
+    def choose_tier(self, document, priority="normal", queue_depth=None):
+        """
+        Pick a tier for a document
+
+        Args:
+            document (ExtractedDocument): Document to summarize
+            priority (str): "low", "normal" or "high"
+            queue_depth (int): Pending jobs; defaults to the router's queue size
+
+        Returns:
+            str: One of TIERS
+        """
+        config = self.config
+        if priority == "high":
+            return TIER_FULL
+        if priority == "low":
+            return TIER_EXTRACTIVE
+
+        word_count = document.word_count
+        if word_count < config.short_word_limit:
+            tier = TIER_EXTRACTIVE
+        elif word_count < config.long_word_limit:
+            tier = TIER_DISTILLED
+        else:
+            tier = TIER_FULL
+
+        # Shift to cheaper tiers under load
+        if queue_depth is None:
+            queue_depth = self.pending.qsize()
+        if queue_depth >= config.queue_hard_limit:
+            return TIER_EXTRACTIVE
+        if queue_depth >= config.queue_soft_limit:
+            return TIERS[max(TIERS.index(tier) - 1, 0)]
+        return tier
+
+    def process_document(self, document, summary_length="medium", priority="normal", queue_depth=None):
+        """Summarize a document with the routed tier; the result records the tier used"""
+        tier = self.choose_tier(document, priority, queue_depth)
+
+        if tier == TIER_EXTRACTIVE:
+            result = self._extractive_result(document)
+        else:
+            result = self.get_summarizer(tier).process_document(document, summary_length)
+
+        result["tier"] = tier
+        result["model"] = TIER_MODELS.get(tier, EXTRACTIVE_MODEL)
+        print(f"Summarized with {tier} tier ({result['model']})")
+        return result
+
+    def process_url(self, url, summary_length="medium", priority="normal"):
+        """Fetch a URL once and summarize it with the routed tier"""
+        print(f"Scraping content from: {url}")
+        document = extract_document(url, max_bytes=self.max_content_bytes)
+        return self.process_document(document, summary_length, priority)
+
+    def submit(self, document, summary_length="medium", priority="normal", callback=None):
+        """
+        Queue a document for run_pending; safe to call from other threads
+
+        If callback is given it is called with the result once the document
+        has been summarized.
+        """
+        self.pending.put((document, summary_length, priority, callback))
+
+    def run_pending(self):
+        """
+        Summarize all queued documents
+
+        The queue size is read once when the batch is taken, and every document
+        in the batch is routed against that same load, so position in the batch
+        does not change the tier. High-priority documents are processed first.
+        A failing job is recorded with tier TIER_FAILED instead of aborting the
+        batch. Results are returned in submission order.
+        """
+        batch = []
+        while True:
+            try:
+                batch.append(self.pending.get_nowait())
+            except queue.Empty:
+                break
+
+        queue_depth = len(batch)
+        results = [None] * len(batch)
+        order = sorted(range(len(batch)), key=lambda i: PRIORITY_ORDER.get(batch[i][2], 1))
+        for i in order:
+            document, summary_length, priority, callback = batch[i]
+            try:
+                result = self.process_document(document, summary_length, priority, queue_depth)
+            except Exception as e:
+                print(f"Summarization failed for {document.url}: {str(e)}")
+                result = {
+                    "url": document.url,
+                    "error": f"Error during summarization: {str(e)}",
+                    "summary": None,
+                    "original_length": len(document.text),
+                    "tier": TIER_FAILED,
+                    "model": None
+                }
+            if callback is not None:
+                callback(result)
+            results[i] = result
+        return results
+
+    def _extractive_result(self, document):
+        """Build a process_document style result from the extractive path"""
+        url = document.url
+        if document.error:
+            return {
+                "url": url,
+                "error": document.error,
+                "summary": None,
+                "original_length": 0
+            }
+
+        content = document.text
+        summary = document.newspaper_summary or extractive_summary(document, self.config.extractive_sentences)
+        return {
+            "url": url,
+            "summary": summary,
+            "original_length": len(content),
+            "summary_length": len(summary),
+            "compression_ratio": f"{len(summary)/len(content)*100:.1f}%"
+        }
@@ -0,0 +1,74 @@
+import json
+import unittest
+
+from article_store import ArticleStore
+from news_records import ArticleDetails, ComprehensiveArticle, SearchHit, dumps
+
+
+def summary_result(title='No title found', newspaper_summary='No summary generated',
+                   textblob_summary='Acme closed a seed round led by Accel.'):
+    """A successful get_news_summary dict, with its placeholders by default"""
+    return {
+        'success': True,
+        'url': 'https://example.com/acme-seed',
+        'timestamp': '2026-10-18T10:00:00',
+        'article': {'title': title, 'authors': [], 'publish_date': None, 'word_count': 7, 'top_image': None},
+        'summaries': {'newspaper3k': newspaper_summary, 'textblob': textblob_summary},
+        'sentiment_analysis': {'polarity': 0.2, 'subjectivity': 0.3,
+                               'sentiment_label': 'positive', 'objectivity_label': 'objective'},
+        'keywords': ['acme', 'seed']
+    }
+
+
+def run_result(detailed_data, company='Acme'):
+    hit = SearchHit(google_news_url='https://news.google.com/read/abc', article_title='Acme raises seed funding')
+    article = ComprehensiveArticle(article_id=1, google_news_data=hit, detailed_data=detailed_data,
+                                   extraction_success=detailed_data is not None)
+    return {'search_query': company, 'scraped_at': '2026-10-18T10:00:00', 'articles': [article]}
+
+
+class ArticleStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.store = ArticleStore(':memory:')
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_title_less_article_round_trip(self):
+        details = ArticleDetails.from_summary(summary_result(), 'https://example.com/acme-seed')
+        self.assertIsNone(details.title)
+        self.assertIsNone(details.content_summary)
+
+        # Through the saved JSON layout and back into the store
+        data = json.loads(dumps(run_result(details)))
+        self.assertEqual(data['articles'][0]['detailed_data']['detailed_title'], 'No title found')
+        self.store.upsert_results(data)
+
+        rows = self.store.query(company='acme')
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['title'], 'Acme raises seed funding')
+        self.assertIsNone(rows[0]['summary'])
+        self.assertEqual(len(self.store.query(keyword='raises')), 1)
+        self.assertEqual(self.store.query(keyword='generated'), [])
+        self.assertEqual(self.store.query(keyword='found'), [])
+
+    def test_failed_and_successful_runs_share_a_row(self):
+        self.store.upsert_results(run_result(None))
+        details = ArticleDetails.from_summary(summary_result(title='Acme raises $3M'), 'https://example.com/acme-seed')
+        self.store.upsert_results(run_result(details, company='ACME'))
+
+        rows = self.store.query()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['final_url'], 'https://example.com/acme-seed')
+        self.assertEqual(rows[0]['title'], 'Acme raises $3M')
+
+    def test_keywords_are_matched_literally(self):
+        details = ArticleDetails.from_summary(summary_result(title='AT&T covid-19 update'), 'https://example.com/x')
+        self.store.upsert_results(run_result(details))
+        self.assertEqual(len(self.store.query(keyword='covid-19')), 1)
+        self.assertEqual(len(self.store.query(keyword='AT&T')), 1)
+        self.assertEqual(len(self.store.query(keyword='accel')), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
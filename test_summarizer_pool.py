@@ -0,0 +1,26 @@
+import importlib.util
+import multiprocessing
+import unittest
+
+HAVE_MODEL_DEPS = all(importlib.util.find_spec(name) for name in ('torch', 'transformers'))
+HAVE_FORK = 'fork' in multiprocessing.get_all_start_methods()
+
+# Tiny randomly initialised BART - enough to exercise forked inference quickly
+TINY_MODEL = 'sshleifer/bart-tiny-random'
+
+
+@unittest.skipUnless(HAVE_MODEL_DEPS and HAVE_FORK, 'needs torch, transformers and the fork start method')
+class SummarizerPoolTests(unittest.TestCase):
+    def test_forked_workers_run_multi_threaded_inference(self):
+        from summarizer_pool import SummarizerPool
+
+        # The pool runs the smoke inference while starting and raises if a worker hangs
+        with SummarizerPool(workers=2, threads_per_worker=2, model_name=TINY_MODEL) as pool:
+            workers = pool.check_workers(timeout=120)
+
+        self.assertEqual(len({pid for pid, _ in workers}), 2)
+        self.assertEqual([threads for _, threads in workers], [2, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()